@@ -56,29 +56,36 @@ def parse_entries(feed_data) -> List[Dict[str, Any]]:
     """
     parsed_entries = []
 
+    # source (journal name) is the same for every entry of a feed
+    source = feed_data.feed.get("title", "Unknown Source")
+
+    # local aliases avoid a global lookup per call inside the loop
+    safe_get = _safe_get
+    parse_authors = _parse_authors
+    parse_date = _parse_date
+
     for item in feed_data.entries:
         entry = {}
 
-        entry["title"] = _safe_get(item, "title", "Untitled Paper")
-        entry["summary"] = _safe_get(item, "summary", "No abstract available")
-        entry["link"] = _safe_get(item, "link", "N/A")
-        entry["authors"] = _parse_authors(item)
+        entry["title"] = safe_get(item, "title", "Untitled Paper")
+        # cleanup summary text formatting
+        entry["summary"] = (
+            safe_get(item, "summary", "No abstract available")
+            .replace("\n", " ")
+            .strip()
+        )
+        entry["link"] = safe_get(item, "link", "N/A")
+        entry["authors"] = parse_authors(item)
 
         # publication date: published > updated > None
         pub_raw = (
-            _safe_get(item, "published", None)
-            or _safe_get(item, "updated", None)
+            safe_get(item, "published", None)
+            or safe_get(item, "updated", None)
         )
-        entry["published"] = _parse_date(pub_raw)
+        entry["published"] = parse_date(pub_raw)
 
-        # source (journal name)
-        entry["source"] = feed_data.feed.get("title", "Unknown Source")
-
-        # cleanup summary text formatting
-        entry["summary"] = entry["summary"].replace("\n", " ").strip()
+        entry["source"] = source
 
         parsed_entries.append(entry)
 
     return parsed_entries
-
-
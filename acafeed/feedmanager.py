@@ -5,19 +5,86 @@ It provides methods to add, remove, and update rss feed links,
 as well as to fetch and parse the rss feeds.
 It also provides slots for the later AI classification module.
 """
+from __future__ import annotations
+
+from collections import OrderedDict
 import datetime
-from dataclasses import dataclass
+from dataclasses import MISSING, dataclass, field, fields
+from bisect import bisect_right
+import functools
+import io
+import logging
 import pickle
-import feedparser
+import re
+import sys
+from typing import TYPE_CHECKING
+import msgpack
+
+logger = logging.getLogger(__name__)
+
+# feedparser, urllib.request and the thread pool are imported where they
+# are used: together they take tens of milliseconds to import, which
+# commands that never touch the network should not pay for.
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    import urllib.request
+    import feedparser
+
+
+@functools.cache
+def _head_opener() -> urllib.request.OpenerDirector:
+    """Returns the opener used for HEAD requests, built on first use."""
+    import urllib.request
+
+    class NoRedirectHandler(urllib.request.HTTPRedirectHandler):
+        """Reports redirects as errors so their status code can be inspected."""
+
+        def redirect_request(self, req, fp, code, msg, headers, newurl):
+            return None
+
+    return urllib.request.build_opener(NoRedirectHandler)
+
+
+def _head_status(link: str, timeout: float = 5) -> int | None:
+    """Returns the HTTP status of a HEAD request to the link.
+
+    Redirects are not followed. Returns None if the link cannot be reached.
+    """
+    import urllib.error
+    import urllib.request
+
+    try:
+        request = urllib.request.Request(link, method="HEAD")
+        with _head_opener().open(request, timeout=timeout) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+    except (OSError, ValueError):
+        # URLError and timeouts are OSErrors; ValueError means a malformed link
+        return None
+
+
+# Statuses that show the link serves a feed, possibly via a redirect
+_OK_STATUSES = frozenset({200, 301, 302, 303, 304, 307, 308})
+# Statuses that show the feed has been removed for good
+_GONE_STATUSES = frozenset({410})
 
 
 # Dataclass feed
-@dataclass
+@dataclass(slots=True)
 class Feed:
     link: str
     name: str
     add_time: datetime.datetime
     last_updated: datetime.datetime
+    # HTTP validators from the last fetch, sent back for conditional GETs;
+    # kept in memory only, like the parsed results they validate
+    etag: str | None = None
+    modified: str | None = None
+    # Whether the link has answered successfully, on validate() or a fetch
+    validated: bool = field(default=False, compare=False)
+    # Lowercased name for case-insensitive search, kept in step with name
+    _name_lower: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Check the inputs are valid."""
@@ -30,13 +97,121 @@ class Feed:
             raise TypeError("add_time must be a datetime.datetime")
         if not isinstance(self.last_updated, datetime.datetime):
             raise TypeError("last_updated must be a datetime.datetime")
-        sample = feedparser.parse(self.link)
-        if sample.status == 301:
-            print(f"Warning: The link {self.link} is redirected (301). Please check if the link is correct.")
-        elif sample.status == 410:
+        self._name_lower = self.name.lower()
+
+    def __setstate__(self, state):
+        """Restores a pickled feed.
+
+        Feeds pickled before Feed used slots carry a plain dict, and may
+        lack fields added since; those fall back to their defaults.
+        """
+        if isinstance(state, tuple):
+            # (instance dict, slot values), as pickled for slotted objects
+            state = {**(state[0] or {}), **(state[1] or {})}
+        for f in fields(self):
+            if not f.init:
+                continue
+            if f.name in state:
+                value = state[f.name]
+            elif f.default is not MISSING:
+                value = f.default
+            else:
+                raise ValueError(f"Pickled feed is missing the field {f.name}")
+            setattr(self, f.name, value)
+        self._name_lower = self.name.lower()
+
+    def validate(self):
+        """Checks that the link still points to a live feed.
+
+        This makes a network request, so it is kept out of the constructor
+        and only called on request. Only a HEAD request is sent, so the feed
+        body is neither downloaded nor parsed. Fetching a feed performs the
+        same check on the response it already has.
+
+        Raises:
+            ValueError: If the link is gone (410).
+        """
+        self._check_status(_head_status(self.link))
+
+    def _check_status(self, status: int | None):
+        """Warns about a permanent redirect and rejects a gone link.
+
+        Marks the feed as validated once the link answers without an error.
+        """
+        if status in _OK_STATUSES:
+            if status == 301:
+                logger.warning(f"Warning: The link {self.link} is redirected (301). Please check if the link is correct.")
+            self.validated = True
+        elif status in _GONE_STATUSES:
             raise ValueError(f"The link {self.link} is gone (410). Please check if the link is correct.")
 
 
+# Pickle protocols 2 and up start with the PROTO opcode; msgpack arrays never do
+_PICKLE_MAGIC = b"\x80"
+
+
+class _LegacyUnpickler(pickle.Unpickler):
+    """Reads feed lists pickled by earlier versions, and nothing else.
+
+    Only the classes a saved feed list refers to may be loaded, so a
+    crafted pickle file cannot run arbitrary code.
+    """
+
+    _ALLOWED = {
+        (__name__, "Feed"),
+        ("datetime", "datetime"),
+        ("datetime", "timedelta"),
+        ("datetime", "timezone"),
+    }
+
+    def find_class(self, module, name):
+        if (module, name) not in self._ALLOWED:
+            raise pickle.UnpicklingError(f"{module}.{name} is not allowed in a feed list")
+        return super().find_class(module, name)
+
+
+def _pack_feed(feed: Feed) -> list:
+    """Converts a feed to the plain record stored by FeedSource.save."""
+    return [
+        feed.link,
+        feed.name,
+        feed.add_time.timestamp(),
+        feed.last_updated.timestamp(),
+        feed.validated,
+    ]
+
+
+def _unpack_feed(record: list) -> Feed:
+    """Rebuilds a feed from a record written by _pack_feed."""
+    link, name, add_time, last_updated, *rest = record
+    return Feed(
+        link=link,
+        name=name,
+        add_time=datetime.datetime.fromtimestamp(add_time),
+        last_updated=datetime.datetime.fromtimestamp(last_updated),
+        # Records saved before the flag existed have four fields
+        validated=bool(rest and rest[0]),
+    )
+
+
+# The least number of parsed feeds FeedSource keeps for answering 304
+# responses; the cache always has room for one result per feed in the list
+_PARSE_CACHE_SIZE = 128
+
+# Printed between feeds in the full pprint listing
+_SEP = "-" * 20
+
+
+def _describe_feed(feed: Feed) -> str:
+    """Formats a feed's details as printed by FeedSource.pprint, without a trailing newline."""
+    return (
+        f"Feed Name: {feed.name}\n"
+        f"Feed Link: {feed.link}\n"
+        f"Added On: {feed.add_time}\n"
+        f"Last Updated: {feed.last_updated}"
+    )
+
+
 class FeedSource:
     """
     The feedsource class is the main class for the feedsource package.
@@ -44,37 +219,66 @@ class FeedSource:
     It provides methods to add, remove, and update rss feed links,
     as well as to fetch and parse the rss feeds.
     It also provides slots for the later AI classification module.
+
+    Feeds are stored in a single dict keyed by name, so a feed name and its
+    feed can never get out of step; _feeds and _feed_names are read-only
+    views of that dict.
     """
 
-    def __init__(self):
+    def __init__(self, *, now: Callable[[], datetime.datetime] = datetime.datetime.now):
         """
         Initializes the feedsource class with an empty dataframe.
         The dataframe has columns for the rss feed link, title, description,
         last updated time, and history data.
+
+        Args:
+            now (Callable[[], datetime.datetime], optional): The clock used to
+                timestamp added and fetched feeds. Defaults to datetime.datetime.now.
         """
-        self._feeds: list[Feed] = []
-        self._feed_names: list[str] = []
+        self._now = now
+        # Name -> feed, in insertion order; the only store of feeds
+        self._by_name: dict[str, Feed] = {}
+        # All lowercased names joined for search_many; rebuilt after any change
+        self._search_blob: tuple[str, list[int], list[Feed]] | None = None
+        # (link, etag) -> last parsed result, least recently used first; only
+        # touched from the calling thread, never from fetch_all's workers
+        self._parse_cache: OrderedDict[tuple[str, str | None], feedparser.FeedParserDict] = OrderedDict()
+
+    @property
+    def _feeds(self) -> list[Feed]:
+        """All feeds, in insertion order."""
+        return list(self._by_name.values())
+
+    @property
+    def _feed_names(self) -> list[str]:
+        """The names of all feeds, in insertion order."""
+        return list(self._by_name)
     
-    def add(self, link: str, name: str):
+    def add(self, link: str, name: str, validate: bool = False):
         """Adds a new RSS feed to the list.
 
         Args:
             link (str): The URL of the RSS feed.
             name (str): A user-defined name for the feed.
+            validate (bool, optional): Whether to check the link over the network
+                before adding it. Otherwise the link is checked on its first fetch.
+                Defaults to False.
 
         Raises:
-            ValueError: If the link is gone (410).
+            ValueError: If validate is set and the link is gone (410).
         """
         # Check if the feed name is already in the list
-        if name in self._feed_names:
-            print(f"The feed name {name} is already in use. Please choose a different name.")
+        if name in self._by_name:
+            logger.warning(f"The feed name {name} is already in use. Please choose a different name.")
             return
         # Add the new feed
-        now = datetime.datetime.now()
+        now = self._now()
         new_feed = Feed(link=link, name=name, add_time=now, last_updated=now)
-        self._feeds.append(new_feed)
-        self._feed_names.append(name)
-        print(f"The feed {name} has been added.")
+        if validate:
+            new_feed.validate()
+        self._by_name[name] = new_feed
+        self._search_blob = None
+        logger.info(f"The feed {name} has been added.")
     
     def remove(self, name: str):
         """Removes an RSS feed from the list by its name.
@@ -82,13 +286,13 @@ class FeedSource:
         Args:
             name (str): The user-defined name of the feed to remove.
         """
-        for i, feed in enumerate(self._feeds):
-            if feed.name == name:
-                self._feeds.pop(i)
-                self._feed_names.remove(name)
-                print(f"The feed {name} has been removed.")
-                return
-        print(f"The feed {name} was not found in the list.")
+        feed = self._by_name.pop(name, None)
+        if feed is None:
+            logger.warning(f"The feed {name} was not found in the list.")
+            return
+        self._parse_cache.pop((feed.link, feed.etag), None)
+        self._search_blob = None
+        logger.info(f"The feed {name} has been removed.")
 
     def change(
             self,
@@ -104,23 +308,32 @@ class FeedSource:
             new_name (str | None, optional): The new name for the feed. Defaults to None.
         """
         if new_link is None and new_name is None:
-            print("No changes specified.")
+            logger.warning("No changes specified.")
             return
-        for feed in self._feeds:
-            if feed.name == name:
-                if new_link is not None:
-                    feed.link = new_link
-                if new_name is not None:
-                    # Check if the new name is already in use
-                    if new_name in self._feed_names:
-                        print(f"The feed name {new_name} is already in use. \
-                              Please choose a different name.")
-                        return
-                    feed.name = new_name
-                    self._feed_names.remove(name)
-                    self._feed_names.append(new_name)
-                print(f"The feed {name} has been updated.")
-                return
+        feed = self._by_name.get(name)
+        if feed is None:
+            return
+        # Check if the new name is already in use
+        if new_name is not None and new_name in self._by_name:
+            logger.warning(f"The feed name {new_name} is already in use. \
+                  Please choose a different name.")
+            return
+        if new_link is not None:
+            # The cached result, validators and validation belong to the old link
+            self._parse_cache.pop((feed.link, feed.etag), None)
+            feed.link = new_link
+            feed.etag = feed.modified = None
+            feed.validated = False
+        if new_name is not None:
+            feed.name = new_name
+            feed._name_lower = new_name.lower()
+            # Rebuild rather than pop and reinsert, to keep the feed's position
+            self._by_name = {
+                new_name if key == name else key: value
+                for key, value in self._by_name.items()
+            }
+            self._search_blob = None
+        logger.info(f"The feed {name} has been updated.")
             
     def search(self, keyword: str) -> list[Feed]:
         """Searches for feeds by a keyword in their name.
@@ -131,8 +344,52 @@ class FeedSource:
         Returns:
             list[Feed]: A list of feeds that match the keyword.
         """
-        results = [feed for feed in self._feeds if keyword.lower() in feed.name.lower()]
+        return self.search_many([keyword])
+
+    def search_many(self, keywords: list[str]) -> list[Feed]:
+        """Searches for feeds whose name contains any of several keywords.
+
+        All keywords are matched in one regex pass over the joined feed
+        names, instead of one substring test per keyword and feed.
+
+        Args:
+            keywords (list[str]): The keywords to search for in feed names.
+
+        Returns:
+            list[Feed]: The feeds that match at least one keyword, in list order.
+        """
+        if not keywords or not self._by_name:
+            return []
+        blob, starts, feeds = self._get_search_blob()
+        lowered = [keyword.lower() for keyword in keywords]
+        pattern = re.compile("|".join(re.escape(keyword) for keyword in lowered))
+        results = []
+        pos = 0
+        while (match := pattern.search(blob, pos)) is not None:
+            i = bisect_right(starts, match.start()) - 1
+            name = feeds[i]._name_lower
+            # A keyword containing the separator can run on into the next name;
+            # such a match does not count, but another keyword may still match
+            if match.end() <= starts[i] + len(name) or any(keyword in name for keyword in lowered):
+                results.append(feeds[i])
+            if i + 1 == len(feeds):
+                break
+            # One match is enough; continue from the next name
+            pos = starts[i + 1]
         return results
+
+    def _get_search_blob(self) -> tuple[str, list[int], list[Feed]]:
+        """Returns the joined lowercased names, their start offsets and their feeds."""
+        if self._search_blob is None:
+            feeds = list(self._by_name.values())
+            starts = []
+            pos = 0
+            for feed in feeds:
+                starts.append(pos)
+                pos += len(feed._name_lower) + 1
+            blob = "\n".join(feed._name_lower for feed in feeds)
+            self._search_blob = (blob, starts, feeds)
+        return self._search_blob
     
     def pprint(self, name: str | None = None):
         """Prints the details of a feed by its name.
@@ -142,50 +399,65 @@ class FeedSource:
                 If None, prints all feeds. Defaults to None.
         """
         if name is None:
-            for feed in self._feeds:
-                print(f"Feed Name: {feed.name}")
-                print(f"Feed Link: {feed.link}")
-                print(f"Added On: {feed.add_time}")
-                print(f"Last Updated: {feed.last_updated}")
-                print("-" * 20)
+            # One write for the whole listing; each feed is followed by a separator
+            blocks = [f"{_describe_feed(feed)}\n{_SEP}\n" for feed in self._by_name.values()]
+            sys.stdout.write("".join(blocks))
         else:
-            for feed in self._feeds:
-                if feed.name == name:
-                    print(f"Feed Name: {feed.name}")
-                    print(f"Feed Link: {feed.link}")
-                    print(f"Added On: {feed.add_time}")
-                    print(f"Last Updated: {feed.last_updated}")
-                    return
-            print(f"The feed {name} was not found in the list.")
+            feed = self._by_name.get(name)
+            if feed is None:
+                logger.warning(f"The feed {name} was not found in the list.")
+                return
+            sys.stdout.write(f"{_describe_feed(feed)}\n")
     
-    def load(self, filepath: str):
-        """Loads the feed list from a pickle file.
+    def load(self, filepath: str) -> bool:
+        """Loads the feed list from a msgpack file.
+
+        Pickle files written by earlier versions are still read, so that
+        they can be migrated by saving them again.
 
         Args:
-            filepath (str): The path to the pickle file.
+            filepath (str): The path to the msgpack or legacy pickle file.
+
+        Returns:
+            bool: Whether the feed list was loaded. On failure the current
+                list is left as it was.
         """
         try:
             with open(filepath, "rb") as f:
-                self._feeds = pickle.load(f)
-            self._feed_names = [feed.name for feed in self._feeds]
-            print(f"Feed list loaded from {filepath}.")
+                if f.peek(1)[:1] == _PICKLE_MAGIC:
+                    # One read and one loads call, instead of many small reads from the file object
+                    feeds = _LegacyUnpickler(io.BytesIO(f.read())).load()
+                else:
+                    # Decode one feed at a time, so the whole file is never held in memory
+                    unpacker = msgpack.Unpacker(f)
+                    feeds = [_unpack_feed(unpacker.unpack()) for _ in range(unpacker.read_array_header())]
+            self._by_name = {feed.name: feed for feed in feeds}
+            self._search_blob = None
+            logger.info(f"Feed list loaded from {filepath}.")
+            return True
         except FileNotFoundError:
-            print(f"The file {filepath} was not found.")
+            logger.warning(f"The file {filepath} was not found.")
         except Exception as e:
-            print(f"An error occurred while loading the file: {e}")
+            logger.error(f"An error occurred while loading the file: {e}")
+        return False
     
     def save(self, filepath: str):
-        """Saves the feed list to a pickle file.
+        """Saves the feed list to a msgpack file.
+
+        Only the feed settings are stored. The HTTP validators stay in
+        memory with the parsed results they refer to: sent on their own after
+        a restart, they would earn a 304 with nothing cached to answer it.
 
         Args:
-            filepath (str): The path to the pickle file.
+            filepath (str): The path to the msgpack file.
         """
         try:
+            data = msgpack.packb([_pack_feed(feed) for feed in self._by_name.values()])
             with open(filepath, "wb") as f:
-                pickle.dump(self._feeds, f)
-            print(f"Feed list saved to {filepath}.")
+                f.write(data)
+            logger.info(f"Feed list saved to {filepath}.")
         except Exception as e:
-            print(f"An error occurred while saving the file: {e}")
+            logger.error(f"An error occurred while saving the file: {e}")
     
     def fetch(self, name: str) -> feedparser.FeedParserDict | None:
         """Fetches and parses the RSS feed by its name.
@@ -195,12 +467,131 @@ class FeedSource:
 
         Returns:
             feedparser.FeedParserDict | None: The parsed feed data, or None if not found.
+
+        Raises:
+            ValueError: If the link is gone (410).
         """
-        if name not in self._feed_names:
-            print(f"The feed {name} was not found in the list.")
+        feed = self._by_name.get(name)
+        if feed is None:
+            logger.warning(f"The feed {name} was not found in the list.")
             return None
-        for feed in self._feeds:
-            if feed.name == name:
-                parsed_feed = feedparser.parse(feed.link)
-                return parsed_feed
-        return None
+        key = (feed.link, feed.etag)
+        parsed = self._parse(feed, self._parse_cache.get(key))
+        self._remember(key, feed, parsed)
+        return parsed
+
+    def fetch_all(
+            self,
+            names: list[str] | None = None,
+            max_workers: int = 8,
+        ) -> dict[str, feedparser.FeedParserDict]:
+        """Fetches and parses several RSS feeds concurrently.
+
+        Parsing is dominated by waiting on the network, so the feeds are
+        fetched from a thread pool and the total time is bounded by the
+        slowest feed rather than the sum of all of them.
+
+        Args:
+            names (list[str] | None, optional): The names of the feeds to fetch.
+                If None, fetches all feeds. Defaults to None.
+            max_workers (int, optional): The maximum number of concurrent fetches.
+                Defaults to 8.
+
+        Returns:
+            dict[str, feedparser.FeedParserDict]: The parsed feed data keyed by feed name.
+                Names that are not in the list and links that are gone (410) are skipped.
+        """
+        if names is None:
+            feeds = list(self._by_name.values())
+        else:
+            feeds = []
+            # Each feed is fetched once, so no two threads ever update the same Feed
+            for name in dict.fromkeys(names):
+                feed = self._by_name.get(name)
+                if feed is None:
+                    logger.warning(f"The feed {name} was not found in the list.")
+                    continue
+                feeds.append(feed)
+        if not feeds:
+            return {}
+        from concurrent.futures import ThreadPoolExecutor
+
+        keys = [(feed.link, feed.etag) for feed in feeds]
+        cached = [self._parse_cache.get(key) for key in keys]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(feeds))) as executor:
+            results = list(executor.map(self._try_parse, feeds, cached))
+        fetched = {}
+        for key, feed, parsed in zip(keys, feeds, results):
+            if parsed is not None:
+                self._remember(key, feed, parsed)
+                fetched[feed.name] = parsed
+        return fetched
+
+    def _remember(self, key: tuple[str, str | None], feed: Feed, parsed: feedparser.FeedParserDict):
+        """Caches a feed's parsed result under its new validators, replacing the entry for key.
+
+        Failed fetches are not cached, and leave the entry for key in place.
+        When the cache is full, the least recently used entry is dropped along
+        with its feeds' validators, which would otherwise earn a 304 with
+        nothing to answer it and cost a second, full request.
+        """
+        if getattr(parsed, "status", None) not in _OK_STATUSES:
+            return
+        self._parse_cache.pop(key, None)
+        self._parse_cache[(feed.link, feed.etag)] = parsed
+        # Each feed holds at most one entry, so only results left over from
+        # feeds that have been loaded over are ever evicted
+        if len(self._parse_cache) > max(_PARSE_CACHE_SIZE, len(self._by_name)):
+            (link, etag), _ = self._parse_cache.popitem(last=False)
+            for other in self._by_name.values():
+                if other.link == link and other.etag == etag:
+                    other.etag = other.modified = None
+
+    def _try_parse(
+            self,
+            feed: Feed,
+            cached: feedparser.FeedParserDict | None = None,
+        ) -> feedparser.FeedParserDict | None:
+        """Like _parse, but reports a gone link instead of raising."""
+        try:
+            return self._parse(feed, cached)
+        except ValueError as e:
+            logger.error(str(e))
+            return None
+
+    def _parse(
+            self,
+            feed: Feed,
+            cached: feedparser.FeedParserDict | None = None,
+        ) -> feedparser.FeedParserDict:
+        """Downloads and parses a single feed.
+
+        The ETag and Last-Modified values from the previous fetch are sent
+        along, so an unchanged feed costs a 304 response and no parsing.
+        Whatever validators the server returns are stored, even on a 304,
+        so the next request always carries the latest ones.
+
+        Args:
+            feed (Feed): The feed to fetch.
+            cached (feedparser.FeedParserDict | None, optional): The result
+                cached for the feed's current link and ETag, returned on a 304.
+                Defaults to None.
+        """
+        import feedparser
+
+        parsed = feedparser.parse(feed.link, etag=feed.etag, modified=feed.modified)
+        if getattr(parsed, "status", None) == 304:
+            if cached is not None:
+                feed.etag = getattr(parsed, "etag", feed.etag)
+                feed.modified = getattr(parsed, "modified", feed.modified)
+                return cached
+            # Nothing to fall back on, so ask for the full feed again
+            parsed = feedparser.parse(feed.link)
+        status = getattr(parsed, "status", None)
+        feed._check_status(status)
+        # A network failure or an error page is not new content
+        if status in _OK_STATUSES and status != 304:
+            feed.etag = getattr(parsed, "etag", None)
+            feed.modified = getattr(parsed, "modified", None)
+            feed.last_updated = self._now()
+        return parsed
@@ -1,35 +1,81 @@
 import os
 import argparse
+import logging
 import pprint
 import acafeed
 
 
+FEEDS_PATH = "feeds.msgpack"
+LEGACY_FEEDS_PATH = "feeds.pkl"
+
+
+def add_feed(db: acafeed.FeedSource, args: argparse.Namespace) -> bool:
+    """Adds a new feed, given as "url (name)". Returns whether the list may have changed."""
+    url, sep, rest = args.add_feed.partition(" (")
+    if not url.startswith(("http://", "https://")):
+        print(f"The link {url} is not an http(s) URL.")
+        return False
+    if not sep:
+        name = url
+    elif rest.endswith(")") and rest[:-1].strip():
+        name = rest[:-1]
+    else:
+        print(f"The name in {args.add_feed} is empty or missing its closing parenthesis.")
+        return False
+    db.add(link=url, name=name)
+    return True
+
+
+def list_feeds(db: acafeed.FeedSource, args: argparse.Namespace) -> bool:
+    """Lists all feeds. Returns whether the list may have changed."""
+    db.pprint()
+    print(f"Total feeds: {len(db._feeds)}")
+    return False
+
+
+def fetch_feeds(db: acafeed.FeedSource, args: argparse.Namespace) -> bool:
+    """Fetches the named feeds, or all of them, concurrently. Returns whether the list may have changed."""
+    pprint.pprint(db.fetch_all(args.fetch or None))
+    # Fetched feeds get a new last-updated time and may become validated
+    return True
+
+
+# Option destination -> handler, run in this order for every option given
+COMMANDS = {
+    "add_feed": add_feed,
+    "list_feeds": list_feeds,
+    "fetch": fetch_feeds,
+}
+
+
 def main():
     # Set up argument parser
     parser = argparse.ArgumentParser(description="AcaFeed Command Line Interface")
-    parser.add_argument('--add-feed', type=str, help='Add a new feed URL')
+    parser.add_argument('--add-feed', type=str, metavar='"URL (NAME)"',
+                        help='Add a new feed URL, optionally followed by its name in parentheses')
     parser.add_argument('--list-feeds', action='store_true', help='List all feeds')
-    parser.add_argument('--fetch', type=str, help='Fetch and update all feeds')
+    parser.add_argument('--fetch', type=str, nargs='*', metavar='NAME',
+                        help='Fetch and update the named feeds, or all feeds if none are named')
     args = parser.parse_args()
+    # Show the library's status messages as plain lines
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
 
     db = acafeed.FeedSource()
-    if os.path.exists("feeds.pkl"):
-        db.load("feeds.pkl")
-
-    if args.add_feed:
-        # Logic to add a new feed]
-        db.add(link=args.add_feed, name="Nature Materials")
-
-    if args.list_feeds:
-        # Logic to list all feeds
-        db.pprint()
-        print(f"Total feeds: {len(db._feeds)}")
-    
-    if args.fetch:
-        # Logic to fetch and update all feeds
-        pprint.pprint(db.fetch(args.fetch))
-    
-    db.save("feeds.pkl")
+    # Only write the feed list back when a command may have changed it
+    dirty = False
+    if os.path.exists(FEEDS_PATH):
+        db.load(FEEDS_PATH)
+    elif os.path.exists(LEGACY_FEEDS_PATH):
+        # One-time migration from the old pickle file; an unreadable one is
+        # left alone rather than replaced by an empty list
+        dirty = db.load(LEGACY_FEEDS_PATH)
+
+    for dest, handler in COMMANDS.items():
+        if getattr(args, dest) not in (None, False):
+            dirty |= handler(db, args)
+
+    if dirty:
+        db.save(FEEDS_PATH)
 
 
 if __name__ == "__main__":
@@ -1,8 +1,10 @@
 import datetime
+import pickle
 import unittest
-from unittest.mock import Mock, patch
-from io import StringIO
+from unittest.mock import patch
+from urllib.error import HTTPError, URLError
 from acafeed import Feed
+from acafeed.feedmanager import _head_opener, _head_status
 
 
 class TestFeed(unittest.TestCase):
@@ -16,15 +18,12 @@ class TestFeed(unittest.TestCase):
         add_time = datetime.datetime.now()
         last_updated = datetime.datetime.now()
         
-        with patch('feedparser.parse') as mock_parse:
-            mock_parse.return_value = Mock(status=200)
-            
-            feed = Feed(link=link, name=name, add_time=add_time, last_updated=last_updated)
-            
-            self.assertEqual(feed.link, link)
-            self.assertEqual(feed.name, name)
-            self.assertEqual(feed.add_time, add_time)
-            self.assertEqual(feed.last_updated, last_updated)
+        feed = Feed(link=link, name=name, add_time=add_time, last_updated=last_updated)
+        
+        self.assertEqual(feed.link, link)
+        self.assertEqual(feed.name, name)
+        self.assertEqual(feed.add_time, add_time)
+        self.assertEqual(feed.last_updated, last_updated)
     
     def test_feed_creation_with_301_redirect_warning(self):
         """Test creating a Feed with a 301 redirect warning."""
@@ -33,13 +32,12 @@ class TestFeed(unittest.TestCase):
         add_time = datetime.datetime.now()
         last_updated = datetime.datetime.now()
         
-        with patch('feedparser.parse') as mock_parse:
-            mock_parse.return_value = Mock(status=301)
-            
-            # 捕获标准输出
-            with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                Feed(link=link, name=name, add_time=add_time, last_updated=last_updated)
-                output = mock_stdout.getvalue()
+        with patch('acafeed.feedmanager._head_status', return_value=301):
+            feed = Feed(link=link, name=name, add_time=add_time, last_updated=last_updated)
+            # 捕获日志输出
+            with self.assertLogs('acafeed', level='INFO') as cm:
+                feed.validate()
+                output = "\n".join(cm.output)
                 self.assertIn("Warning: The link", output)
                 self.assertIn("is redirected (301)", output)
     
@@ -50,11 +48,19 @@ class TestFeed(unittest.TestCase):
         add_time = datetime.datetime.now()
         last_updated = datetime.datetime.now()
         
-        with patch('feedparser.parse') as mock_parse:
-            mock_parse.return_value = Mock(status=410)
-            
+        with patch('acafeed.feedmanager._head_status', return_value=410):
+            feed = Feed(link=link, name=name, add_time=add_time, last_updated=last_updated)
             with self.assertRaisesRegex(ValueError, "The link .* is gone \\(410\\)"):
-                Feed(link=link, name=name, add_time=add_time, last_updated=last_updated)
+                feed.validate()
+    
+    def test_feed_creation_does_not_fetch_link(self):
+        """Test that creating a Feed does not touch the network."""
+        add_time = datetime.datetime.now()
+        last_updated = datetime.datetime.now()
+
+        with patch('feedparser.parse') as mock_parse:
+            Feed(link="http://example.com/rss", name="Test", add_time=add_time, last_updated=last_updated)
+            mock_parse.assert_not_called()
     
     def test_feed_invalid_link_type(self):
         """Test creating a Feed with an invalid link type."""
@@ -103,14 +109,15 @@ class TestFeed(unittest.TestCase):
         add_time = datetime.datetime.now()
         last_updated = datetime.datetime.now()
         
-        with patch('feedparser.parse') as mock_parse:
-            mock_parse.return_value = Mock(status=200)
-            
+        with patch('acafeed.feedmanager._head_status', return_value=200):
             # 应该能够成功创建，不应抛出异常
             feed = Feed(link=link, name=name, add_time=add_time, last_updated=last_updated)
+            self.assertFalse(feed.validated)
+            feed.validate()
             
             self.assertEqual(feed.link, link)
             self.assertEqual(feed.name, name)
+            self.assertTrue(feed.validated)
     
     def test_feed_creation_with_other_error_status(self):
         """Test creating a Feed with other HTTP error status codes (non-301 and non-410)."""
@@ -119,14 +126,15 @@ class TestFeed(unittest.TestCase):
         add_time = datetime.datetime.now()
         last_updated = datetime.datetime.now()
         
-        with patch('feedparser.parse') as mock_parse:
-            mock_parse.return_value = Mock(status=404)
-            
-            # For other error statuses that are not 301 or 410, creation should succeed (no special handling)
+        with patch('acafeed.feedmanager._head_status', return_value=404):
+            # For other error statuses that are not 301 or 410, validation should succeed (no special handling)
             feed = Feed(link=link, name=name, add_time=add_time, last_updated=last_updated)
+            feed.validate()
             
             self.assertEqual(feed.link, link)
             self.assertEqual(feed.name, name)
+            # An error response does not count as validated
+            self.assertFalse(feed.validated)
     
     def test_feed_creation_with_none_values(self):
         """Test creating a Feed with None values."""
@@ -156,22 +164,50 @@ class TestFeed(unittest.TestCase):
         add_time = datetime.datetime(2023, 1, 1, 12, 0, 0)
         last_updated = datetime.datetime(2023, 1, 2, 12, 0, 0)
         
-        with patch('feedparser.parse') as mock_parse:
-            mock_parse.return_value = Mock(status=200)
-            
-            feed = Feed(link=link, name=name, add_time=add_time, last_updated=last_updated)
-            
-            # Verify all attributes can be accessed correctly
-            self.assertTrue(hasattr(feed, 'link'))
-            self.assertTrue(hasattr(feed, 'name'))
-            self.assertTrue(hasattr(feed, 'add_time'))
-            self.assertTrue(hasattr(feed, 'last_updated'))
-            
-            # Verify attribute values are correct
-            self.assertEqual(feed.link, link)
-            self.assertEqual(feed.name, name)
-            self.assertEqual(feed.add_time, add_time)
-            self.assertEqual(feed.last_updated, last_updated)
+        feed = Feed(link=link, name=name, add_time=add_time, last_updated=last_updated)
+        
+        # Verify all attributes can be accessed correctly
+        self.assertTrue(hasattr(feed, 'link'))
+        self.assertTrue(hasattr(feed, 'name'))
+        self.assertTrue(hasattr(feed, 'add_time'))
+        self.assertTrue(hasattr(feed, 'last_updated'))
+        
+        # Verify attribute values are correct
+        self.assertEqual(feed.link, link)
+        self.assertEqual(feed.name, name)
+        self.assertEqual(feed.add_time, add_time)
+        self.assertEqual(feed.last_updated, last_updated)
+    
+    def test_feed_uses_slots(self):
+        """Test that Feed instances have no per-instance __dict__."""
+        feed = Feed(link="http://example.com/rss", name="Test",
+                    add_time=datetime.datetime.now(), last_updated=datetime.datetime.now())
+        self.assertFalse(hasattr(feed, '__dict__'))
+    
+    def test_feed_pickle_round_trip(self):
+        """Test that a Feed survives pickling."""
+        feed = Feed(link="http://example.com/rss", name="Test",
+                    add_time=datetime.datetime(2023, 1, 1), last_updated=datetime.datetime(2023, 1, 2),
+                    etag='"abc"')
+        restored = pickle.loads(pickle.dumps(feed, protocol=pickle.HIGHEST_PROTOCOL))
+        self.assertEqual(restored, feed)
+        self.assertEqual(restored.etag, '"abc"')
+    
+    def test_feed_setstate_from_legacy_dict(self):
+        """Test restoring a Feed pickled before slots and newer fields existed."""
+        feed = Feed.__new__(Feed)
+        feed.__setstate__({
+            'link': "http://example.com/rss",
+            'name': "Test",
+            'add_time': datetime.datetime(2023, 1, 1),
+            'last_updated': datetime.datetime(2023, 1, 2),
+        })
+        self.assertEqual(feed.link, "http://example.com/rss")
+        self.assertEqual(feed.name, "Test")
+        self.assertIsNone(feed.etag)
+        self.assertIsNone(feed.modified)
+        self.assertFalse(feed.validated)
+        self.assertEqual(feed._name_lower, "test")
     
     def test_feed_with_edge_case_types(self):
         """Test Feed handling edge case types."""
@@ -179,32 +215,36 @@ class TestFeed(unittest.TestCase):
         last_updated = datetime.datetime.now()
 
         # Test empty strings (should succeed)
-        with patch('feedparser.parse') as mock_parse:
-            mock_parse.return_value = Mock(status=200)
-            
-            feed = Feed(link="", name="", add_time=add_time, last_updated=last_updated)
-            self.assertEqual(feed.link, "")
-            self.assertEqual(feed.name, "")
+        feed = Feed(link="", name="", add_time=add_time, last_updated=last_updated)
+        self.assertEqual(feed.link, "")
+        self.assertEqual(feed.name, "")
     
-    def test_feed_feedparser_without_status_attribute(self):
-        """Test feedparser returning an object without a status attribute."""
+    def test_feed_validate_unreachable_link(self):
+        """Test validating a link that cannot be reached at all."""
         link = "http://www.nature.com/nmat/current_issue/rss/"
         name = "Nature Materials"
         add_time = datetime.datetime.now()
         last_updated = datetime.datetime.now()
         
-        with patch('feedparser.parse') as mock_parse:
-            # Simulate an object without a status attribute
-            mock_result = Mock()
-            del mock_result.status
-            mock_parse.return_value = mock_result
-
-            # Should be able to create successfully (no status check)
-            try:
-                feed = Feed(link=link, name=name, add_time=add_time, last_updated=last_updated)
-                self.assertEqual(feed.link, link)
-                self.assertEqual(feed.name, name)
-            except AttributeError:
-                # If an AttributeError is raised, it means the code tried to access a non-existent status attribute
-                # This is the expected behavior because the original code directly accesses sample.status
-                pass
+        with patch('acafeed.feedmanager._head_status', return_value=None):
+            # No status means no special handling
+            feed = Feed(link=link, name=name, add_time=add_time, last_updated=last_updated)
+            feed.validate()
+            self.assertEqual(feed.link, link)
+            self.assertEqual(feed.name, name)
+            self.assertFalse(feed.validated)
+    
+    def test_head_status_returns_error_code(self):
+        """Test that HTTP errors, including unfollowed redirects, report their code."""
+        error = HTTPError("http://example.com/rss", 301, "Moved Permanently", {}, None)
+        with patch.object(_head_opener(), 'open', side_effect=error) as mock_open:
+            self.assertEqual(_head_status("http://example.com/rss"), 301)
+            request = mock_open.call_args.args[0]
+            self.assertEqual(request.get_method(), "HEAD")
+    
+    def test_head_status_unreachable(self):
+        """Test that an unreachable link has no status."""
+        with patch.object(_head_opener(), 'open', side_effect=URLError("no route")):
+            self.assertIsNone(_head_status("http://example.com/rss"))
+        # Not a URL at all
+        self.assertIsNone(_head_status(""))
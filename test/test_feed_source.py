@@ -1,35 +1,71 @@
+import copy
 import datetime
+import pickle
 import unittest
 import tempfile
 import os
+from contextlib import redirect_stdout
 from unittest.mock import Mock, patch
 from io import StringIO
-from acafeed import FeedSource
+import msgpack
+from acafeed import Feed, FeedSource
+
+
+# Shared parse result for tests that only need a successful response
+_OK_RESPONSE = Mock(status=200, etag=None, modified=None)
 
 
 class TestFeedSource(unittest.TestCase):
     """Unit tests for the FeedSource class."""
     
+    test_link = "http://www.nature.com/nmat/current_issue/rss/"
+    test_name = "Nature Materials"
+    
+    @classmethod
+    def setUpClass(cls):
+        """Build the populated feed lists once; tests work on deep copies."""
+        cls._prototype = FeedSource()
+        cls._prototype.add(cls.test_link, cls.test_name)
+        cls._prototype_pair = FeedSource()
+        cls._prototype_pair.add(cls.test_link, "Feed 1")
+        cls._prototype_pair.add("http://example.com/rss", "Feed 2")
+        # Scratch directory shared by the save/load tests
+        cls._tmpdir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(cls._tmpdir.cleanup)
+        # One feedparser.parse patch for the whole class; setUp resets it
+        cls._parse_patcher = patch('feedparser.parse')
+        cls.mock_parse = cls._parse_patcher.start()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Undo the class-wide feedparser.parse patch."""
+        cls._parse_patcher.stop()
+    
     def setUp(self):
         """Set up test fixtures before each test method."""
         self.feed_source = FeedSource()
-        self.test_link = "http://www.nature.com/nmat/current_issue/rss/"
-        self.test_name = "Nature Materials"
-        
+        self.mock_parse.reset_mock(return_value=True, side_effect=True)
+        self.mock_parse.return_value = _OK_RESPONSE
+        # Keep link validation in add() off the network
+        patcher = patch('acafeed.feedmanager._head_status', return_value=200)
+        self.mock_head_status = patcher.start()
+        self.addCleanup(patcher.stop)
+        
+    def _temp_path(self, suffix=".msgpack"):
+        """Return a file path in the shared scratch directory unique to this test."""
+        return os.path.join(self._tmpdir.name, f"{self.id()}{suffix}")
+    
     def test_init(self):
         """Test FeedSource initialization."""
         feed_source = FeedSource()
         self.assertEqual(feed_source._feeds, [])
         self.assertEqual(feed_source._feed_names, [])
     
-    @patch('feedparser.parse')
-    def test_add_new_feed_success(self, mock_parse):
+    def test_add_new_feed_success(self):
         """Test successfully adding a new feed."""
-        mock_parse.return_value = Mock(status=200)
-        
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+        with self.assertLogs('acafeed', level='INFO') as cm:
             self.feed_source.add(self.test_link, self.test_name)
-            output = mock_stdout.getvalue()
+            output = "\n".join(cm.output)
             self.assertIn(f"The feed {self.test_name} has been added.", output)
         
         self.assertEqual(len(self.feed_source._feeds), 1)
@@ -42,49 +78,59 @@ class TestFeedSource(unittest.TestCase):
         self.assertIsInstance(added_feed.add_time, datetime.datetime)
         self.assertIsInstance(added_feed.last_updated, datetime.datetime)
     
-    @patch('feedparser.parse')
-    def test_add_duplicate_name_feed(self, mock_parse):
+    def test_add_uses_injected_clock(self):
+        """Test that added feeds are timestamped with the given clock."""
+        fixed = datetime.datetime(2024, 1, 1, 12, 0)
+        feed_source = FeedSource(now=lambda: fixed)
+        feed_source.add(self.test_link, self.test_name)
+        
+        feed = feed_source._feeds[0]
+        self.assertEqual(feed.add_time, fixed)
+        self.assertEqual(feed.last_updated, fixed)
+    
+    def test_add_duplicate_name_feed(self):
         """Test adding a feed with duplicate name."""
-        mock_parse.return_value = Mock(status=200)
-        
-        # Add first feed
-        self.feed_source.add(self.test_link, self.test_name)
+        # Start from a list holding one feed
+        self.feed_source = copy.deepcopy(self._prototype)
         
         # Try to add feed with same name
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+        with self.assertLogs('acafeed', level='INFO') as cm:
             self.feed_source.add("http://example.com/rss", self.test_name)
-            output = mock_stdout.getvalue()
+            output = "\n".join(cm.output)
             self.assertIn(f"The feed name {self.test_name} is already in use.", output)
         
         # Should still have only one feed
         self.assertEqual(len(self.feed_source._feeds), 1)
         self.assertEqual(len(self.feed_source._feed_names), 1)
     
-    @patch('feedparser.parse')
-    def test_add_feed_with_410_error(self, mock_parse):
+    def test_add_feed_with_410_error(self):
         """Test adding a feed that returns 410 error."""
-        mock_parse.return_value = Mock(status=410)
+        self.mock_head_status.return_value = 410
         
         with self.assertRaisesRegex(ValueError, "The link .* is gone \\(410\\)"):
-            self.feed_source.add(self.test_link, self.test_name)
+            self.feed_source.add(self.test_link, self.test_name, validate=True)
         
         # Feed should not be added due to error
         self.assertEqual(len(self.feed_source._feeds), 0)
         self.assertEqual(len(self.feed_source._feed_names), 0)
     
-    @patch('feedparser.parse')
-    def test_remove_existing_feed(self, mock_parse):
-        """Test removing an existing feed."""
-        mock_parse.return_value = Mock(status=200)
-        
-        # Add a feed first
+    def test_add_feed_without_validation(self):
+        """Test that adding a feed does not touch the network by default."""
         self.feed_source.add(self.test_link, self.test_name)
+        
+        self.mock_head_status.assert_not_called()
+        self.assertIn(self.test_name, self.feed_source._feed_names)
+    
+    def test_remove_existing_feed(self):
+        """Test removing an existing feed."""
+        # Start from a list holding one feed
+        self.feed_source = copy.deepcopy(self._prototype)
         self.assertEqual(len(self.feed_source._feeds), 1)
         
         # Remove the feed
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+        with self.assertLogs('acafeed', level='INFO') as cm:
             self.feed_source.remove(self.test_name)
-            output = mock_stdout.getvalue()
+            output = "\n".join(cm.output)
             self.assertIn(f"The feed {self.test_name} has been removed.", output)
         
         self.assertEqual(len(self.feed_source._feeds), 0)
@@ -92,24 +138,21 @@ class TestFeedSource(unittest.TestCase):
     
     def test_remove_nonexistent_feed(self):
         """Test removing a feed that doesn't exist."""
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+        with self.assertLogs('acafeed', level='INFO') as cm:
             self.feed_source.remove("Nonexistent Feed")
-            output = mock_stdout.getvalue()
+            output = "\n".join(cm.output)
             self.assertIn("The feed Nonexistent Feed was not found in the list.", output)
     
-    @patch('feedparser.parse')
-    def test_change_feed_link_only(self, mock_parse):
+    def test_change_feed_link_only(self):
         """Test changing only the link of an existing feed."""
-        mock_parse.return_value = Mock(status=200)
-        
-        # Add a feed first
-        self.feed_source.add(self.test_link, self.test_name)
+        # Start from a list holding one feed
+        self.feed_source = copy.deepcopy(self._prototype)
         
         # Change only the link
         new_link = "http://example.com/new_rss"
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+        with self.assertLogs('acafeed', level='INFO') as cm:
             self.feed_source.change(self.test_name, new_link=new_link)
-            output = mock_stdout.getvalue()
+            output = "\n".join(cm.output)
             self.assertIn(f"The feed {self.test_name} has been updated.", output)
         
         # Check that link was updated but name remained the same
@@ -118,19 +161,33 @@ class TestFeedSource(unittest.TestCase):
         self.assertEqual(updated_feed.name, self.test_name)
         self.assertIn(self.test_name, self.feed_source._feed_names)
     
-    @patch('feedparser.parse')
-    def test_change_feed_name_only(self, mock_parse):
-        """Test changing only the name of an existing feed."""
-        mock_parse.return_value = Mock(status=200)
+    def test_change_feed_link_resets_validation(self):
+        """Test that a new link is neither validated nor sent the old link's validators."""
+        self.feed_source = copy.deepcopy(self._prototype)
+        self.mock_parse.return_value = Mock(status=200, etag='"v1"', modified="Mon, 01 Jan 2024 00:00:00 GMT")
+        self.feed_source.fetch(self.test_name)
+        feed = self.feed_source._feeds[0]
+        self.assertTrue(feed.validated)
         
-        # Add a feed first
-        self.feed_source.add(self.test_link, self.test_name)
+        new_link = "http://example.com/new_rss"
+        self.feed_source.change(self.test_name, new_link=new_link)
+        
+        self.assertFalse(feed.validated)
+        self.assertIsNone(feed.etag)
+        self.assertIsNone(feed.modified)
+        self.feed_source.fetch(self.test_name)
+        self.mock_parse.assert_called_with(new_link, etag=None, modified=None)
+    
+    def test_change_feed_name_only(self):
+        """Test changing only the name of an existing feed."""
+        # Start from a list holding one feed
+        self.feed_source = copy.deepcopy(self._prototype)
         
         # Change only the name
         new_name = "New Nature Materials"
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+        with self.assertLogs('acafeed', level='INFO') as cm:
             self.feed_source.change(self.test_name, new_name=new_name)
-            output = mock_stdout.getvalue()
+            output = "\n".join(cm.output)
             self.assertIn(f"The feed {self.test_name} has been updated.", output)
         
         # Check that name was updated but link remained the same
@@ -140,20 +197,17 @@ class TestFeedSource(unittest.TestCase):
         self.assertNotIn(self.test_name, self.feed_source._feed_names)
         self.assertIn(new_name, self.feed_source._feed_names)
     
-    @patch('feedparser.parse')
-    def test_change_feed_both_link_and_name(self, mock_parse):
+    def test_change_feed_both_link_and_name(self):
         """Test changing both link and name of an existing feed."""
-        mock_parse.return_value = Mock(status=200)
-        
-        # Add a feed first
-        self.feed_source.add(self.test_link, self.test_name)
+        # Start from a list holding one feed
+        self.feed_source = copy.deepcopy(self._prototype)
         
         # Change both link and name
         new_link = "http://example.com/new_rss"
         new_name = "New Nature Materials"
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+        with self.assertLogs('acafeed', level='INFO') as cm:
             self.feed_source.change(self.test_name, new_link=new_link, new_name=new_name)
-            output = mock_stdout.getvalue()
+            output = "\n".join(cm.output)
             self.assertIn(f"The feed {self.test_name} has been updated.", output)
         
         # Check that both were updated
@@ -163,31 +217,50 @@ class TestFeedSource(unittest.TestCase):
         self.assertNotIn(self.test_name, self.feed_source._feed_names)
         self.assertIn(new_name, self.feed_source._feed_names)
     
-    @patch('feedparser.parse')
-    def test_change_feed_name_to_existing_name(self, mock_parse):
+    def test_change_feed_name_to_existing_name(self):
         """Test changing feed name to an already existing name."""
-        mock_parse.return_value = Mock(status=200)
-        
         # Add two feeds
-        self.feed_source.add(self.test_link, self.test_name)
+        self.feed_source = copy.deepcopy(self._prototype)
         second_name = "Second Feed"
         self.feed_source.add("http://example.com/rss", second_name)
         
         # Try to change second feed name to first feed's name
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+        with self.assertLogs('acafeed', level='INFO') as cm:
             self.feed_source.change(second_name, new_name=self.test_name)
-            output = mock_stdout.getvalue()
+            output = "\n".join(cm.output)
             self.assertIn(f"The feed name {self.test_name} is already in use.", output)
         
         # Names should remain unchanged
         self.assertIn(self.test_name, self.feed_source._feed_names)
         self.assertIn(second_name, self.feed_source._feed_names)
     
+    def test_change_feed_name_updates_lookup(self):
+        """Test that a renamed feed is found under its new name only."""
+        self.feed_source = copy.deepcopy(self._prototype)
+        self.feed_source.change(self.test_name, new_name="Renamed")
+        
+        with self.assertLogs('acafeed', level='INFO') as cm:
+            self.assertIsNone(self.feed_source.fetch(self.test_name))
+            self.assertIn(f"The feed {self.test_name} was not found in the list.", "\n".join(cm.output))
+        
+        self.mock_parse.return_value = _OK_RESPONSE
+        self.assertIsNotNone(self.feed_source.fetch("Renamed"))
+        self.mock_parse.assert_called_with(self.test_link, etag=None, modified=None)
+    
+    def test_change_feed_name_keeps_order(self):
+        """Test that renaming a feed keeps its position in the list."""
+        self.feed_source = copy.deepcopy(self._prototype_pair)
+        
+        self.feed_source.change("Feed 1", new_name="Feed 0")
+        
+        self.assertEqual(self.feed_source._feed_names, ["Feed 0", "Feed 2"])
+        self.assertEqual([feed.name for feed in self.feed_source._feeds], ["Feed 0", "Feed 2"])
+    
     def test_change_no_parameters(self):
         """Test change method with no parameters specified."""
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+        with self.assertLogs('acafeed', level='INFO') as cm:
             self.feed_source.change("Some Feed")
-            output = mock_stdout.getvalue()
+            output = "\n".join(cm.output)
             self.assertIn("No changes specified.", output)
     
     def test_change_nonexistent_feed(self):
@@ -198,11 +271,8 @@ class TestFeedSource(unittest.TestCase):
         self.feed_source.change("Nonexistent Feed", new_link="http://example.com")
         self.assertEqual(len(self.feed_source._feeds), original_feeds_count)
     
-    @patch('feedparser.parse')
-    def test_search_with_matches(self, mock_parse):
+    def test_search_with_matches(self):
         """Test searching for feeds with keyword matches."""
-        mock_parse.return_value = Mock(status=200)
-        
         # Add multiple feeds
         self.feed_source.add(self.test_link, "Nature Materials")
         self.feed_source.add("http://example.com/rss", "Science Materials")
@@ -218,24 +288,59 @@ class TestFeedSource(unittest.TestCase):
         self.assertIn("Science Materials", result_names)
         self.assertNotIn("Physics Today", result_names)
     
-    @patch('feedparser.parse')
-    def test_search_case_insensitive(self, mock_parse):
+    def test_search_case_insensitive(self):
         """Test that search is case insensitive."""
-        mock_parse.return_value = Mock(status=200)
+        self.feed_source = copy.deepcopy(self._prototype)
         
+        for keyword in ("nature", "NATURE", "NaTuRe"):
+            with self.subTest(keyword=keyword):
+                results = self.feed_source.search(keyword)
+                self.assertEqual([feed.name for feed in results], ["Nature Materials"])
+    
+    def test_search_after_rename(self):
+        """Test that search matches a renamed feed by its new name only."""
         self.feed_source.add(self.test_link, "Nature Materials")
+        self.feed_source.change("Nature Materials", new_name="Physics Today")
         
-        # Search with different cases
-        results_lower = self.feed_source.search("nature")
-        results_upper = self.feed_source.search("NATURE")
-        results_mixed = self.feed_source.search("NaTuRe")
+        self.assertEqual(self.feed_source.search("nature"), [])
+        results = self.feed_source.search("PHYSICS")
+        self.assertEqual([feed.name for feed in results], ["Physics Today"])
+    
+    def test_search_many(self):
+        """Test searching for several keywords at once."""
+        self.feed_source.add(self.test_link, "Nature Materials")
+        self.feed_source.add("http://example.com/rss", "Science (AAAS)")
+        self.feed_source.add("http://test.com/rss", "Physics Today")
+        
+        results = self.feed_source.search_many(["today", "MATERIALS", "(aaas)"])
+        
+        # Results follow list order, and regex characters are matched literally
+        self.assertEqual(
+            [feed.name for feed in results],
+            ["Nature Materials", "Science (AAAS)", "Physics Today"],
+        )
+        self.assertEqual(self.feed_source.search_many([]), [])
+        self.assertEqual(self.feed_source.search_many(["chemistry"]), [])
+        
+        # A keyword cannot match the end of one name and the start of the next,
+        # nor hide a later keyword that does match the first name
+        feed_source = FeedSource()
+        feed_source.add(self.test_link, "ab")
+        feed_source.add("http://example.com/rss", "cd")
+        self.assertEqual(feed_source.search("b\nc"), [])
+        self.assertEqual([feed.name for feed in feed_source.search_many(["b\nc", "b"])], ["ab"])
+    
+    def test_search_many_sees_list_changes(self):
+        """Test that search results follow added and removed feeds."""
+        self.feed_source.add(self.test_link, "Nature Materials")
+        self.assertEqual(len(self.feed_source.search_many(["materials"])), 1)
         
-        self.assertEqual(len(results_lower), 1)
-        self.assertEqual(len(results_upper), 1)
-        self.assertEqual(len(results_mixed), 1)
+        self.feed_source.add("http://example.com/rss", "Science Materials")
+        self.assertEqual(len(self.feed_source.search_many(["materials"])), 2)
         
-        for results in [results_lower, results_upper, results_mixed]:
-            self.assertEqual(results[0].name, "Nature Materials")
+        self.feed_source.remove("Nature Materials")
+        results = self.feed_source.search_many(["materials"])
+        self.assertEqual([feed.name for feed in results], ["Science Materials"])
     
     def test_search_no_matches(self):
         """Test searching with no matches."""
@@ -243,192 +348,476 @@ class TestFeedSource(unittest.TestCase):
         self.assertEqual(len(results), 0)
         self.assertEqual(results, [])
     
-    @patch('feedparser.parse')
-    def test_pprint_all_feeds(self, mock_parse):
-        """Test printing all feeds."""
-        mock_parse.return_value = Mock(status=200)
-        
-        # Add multiple feeds
-        self.feed_source.add(self.test_link, "Feed 1")
-        self.feed_source.add("http://example.com/rss", "Feed 2")
-        
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            self.feed_source.pprint()
-            output = mock_stdout.getvalue()
-            
-            # Check that both feeds are printed
-            self.assertIn("Feed Name: Feed 1", output)
-            self.assertIn("Feed Name: Feed 2", output)
-            self.assertIn(f"Feed Link: {self.test_link}", output)
-            self.assertIn("Feed Link: http://example.com/rss", output)
-            self.assertIn("Added On:", output)
-            self.assertIn("Last Updated:", output)
-            self.assertIn("-" * 20, output)
-    
-    @patch('feedparser.parse')
-    def test_pprint_specific_feed(self, mock_parse):
-        """Test printing a specific feed."""
-        mock_parse.return_value = Mock(status=200)
-        
-        self.feed_source.add(self.test_link, self.test_name)
-        
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            self.feed_source.pprint(self.test_name)
-            output = mock_stdout.getvalue()
-            
-            self.assertIn(f"Feed Name: {self.test_name}", output)
-            self.assertIn(f"Feed Link: {self.test_link}", output)
-            self.assertIn("Added On:", output)
-            self.assertIn("Last Updated:", output)
-            # Should not contain separator since only one feed is printed
-            self.assertNotIn("-" * 20, output)
+    def test_pprint(self):
+        """Test printing all feeds, and a specific feed."""
+        self.feed_source = copy.deepcopy(self._prototype_pair)
+        # name passed to pprint -> (feeds expected in the output, whether separators are printed)
+        cases = {
+            None: ({"Feed 1": self.test_link, "Feed 2": "http://example.com/rss"}, True),
+            "Feed 2": ({"Feed 2": "http://example.com/rss"}, False),
+        }
+        
+        for name, (expected, separated) in cases.items():
+            with self.subTest(name=name):
+                buf = StringIO()
+                with redirect_stdout(buf):
+                    self.feed_source.pprint(name)
+                output = buf.getvalue()
+                
+                for feed_name, feed_link in expected.items():
+                    self.assertIn(f"Feed Name: {feed_name}", output)
+                    self.assertIn(f"Feed Link: {feed_link}", output)
+                self.assertEqual(output.count("Feed Name:"), len(expected))
+                self.assertIn("Added On:", output)
+                self.assertIn("Last Updated:", output)
+                # A single feed is printed without a separator
+                self.assertEqual("-" * 20 in output, separated)
     
     def test_pprint_nonexistent_feed(self):
         """Test printing a feed that doesn't exist."""
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+        with self.assertLogs('acafeed', level='INFO') as cm:
             self.feed_source.pprint("Nonexistent Feed")
-            output = mock_stdout.getvalue()
+            output = "\n".join(cm.output)
             self.assertIn("The feed Nonexistent Feed was not found in the list.", output)
             
     def test_pprint_empty_feed_list_with_specific_name(self):
         """Test printing a specific feed when no feeds exist."""
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+        with self.assertLogs('acafeed', level='INFO') as cm:
             self.feed_source.pprint("Some Feed")
-            output = mock_stdout.getvalue()
+            output = "\n".join(cm.output)
             # Should show not found message
             self.assertIn("The feed Some Feed was not found in the list.", output)
     
-    @patch('feedparser.parse')
-    def test_save_and_load_feeds(self, mock_parse):
+    def test_save_and_load_feeds(self):
         """Test saving and loading feeds to/from pickle file."""
-        mock_parse.return_value = Mock(status=200)
-        
-        # Add some feeds
-        self.feed_source.add(self.test_link, "Feed 1")
-        self.feed_source.add("http://example.com/rss", "Feed 2")
+        # Start from a list holding two feeds
+        self.feed_source = copy.deepcopy(self._prototype_pair)
         
         # Save to temporary file
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            temp_filepath = temp_file.name
-        
-        try:
-            with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                self.feed_source.save(temp_filepath)
-                output = mock_stdout.getvalue()
-                self.assertIn(f"Feed list saved to {temp_filepath}.", output)
-            
-            # Create new FeedSource and load
-            new_feed_source = FeedSource()
-            with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                new_feed_source.load(temp_filepath)
-                output = mock_stdout.getvalue()
-                self.assertIn(f"Feed list loaded from {temp_filepath}.", output)
-            
-            # Verify loaded data
-            self.assertEqual(len(new_feed_source._feeds), 2)
-            self.assertEqual(len(new_feed_source._feed_names), 2)
-            self.assertIn("Feed 1", new_feed_source._feed_names)
-            self.assertIn("Feed 2", new_feed_source._feed_names)
-            
-            # Check feed details
-            feed_names = [feed.name for feed in new_feed_source._feeds]
-            self.assertIn("Feed 1", feed_names)
-            self.assertIn("Feed 2", feed_names)
-            
-        finally:
-            # Clean up temporary file
-            if os.path.exists(temp_filepath):
-                os.unlink(temp_filepath)
+        temp_filepath = self._temp_path()
+        
+        with self.assertLogs('acafeed', level='INFO') as cm:
+            self.feed_source.save(temp_filepath)
+            output = "\n".join(cm.output)
+            self.assertIn(f"Feed list saved to {temp_filepath}.", output)
+        
+        # Create new FeedSource and load
+        new_feed_source = FeedSource()
+        with self.assertLogs('acafeed', level='INFO') as cm:
+            new_feed_source.load(temp_filepath)
+            output = "\n".join(cm.output)
+            self.assertIn(f"Feed list loaded from {temp_filepath}.", output)
+        
+        # Verify loaded data
+        self.assertEqual(len(new_feed_source._feeds), 2)
+        self.assertEqual(len(new_feed_source._feed_names), 2)
+        self.assertIn("Feed 1", new_feed_source._feed_names)
+        self.assertIn("Feed 2", new_feed_source._feed_names)
+        
+        # Check feed details
+        feed_names = [feed.name for feed in new_feed_source._feeds]
+        self.assertIn("Feed 1", feed_names)
+        self.assertIn("Feed 2", feed_names)
+    
+    def test_save_and_load_preserves_feed_fields(self):
+        """Test that saving and loading keeps timestamps but not HTTP validators."""
+        feed = Feed(
+            link=self.test_link,
+            name=self.test_name,
+            add_time=datetime.datetime(2023, 1, 1, 12, 30, 15, 123456),
+            last_updated=datetime.datetime(2023, 1, 2, 8, 0, 0, 654321),
+            etag='"abc"',
+            modified="Mon, 02 Jan 2023 08:00:00 GMT",
+            validated=True,
+        )
+        self.feed_source._by_name[feed.name] = feed
+        
+        temp_filepath = self._temp_path()
+        self.feed_source.save(temp_filepath)
+        new_feed_source = FeedSource()
+        new_feed_source.load(temp_filepath)
+        
+        loaded = new_feed_source._feeds[0]
+        self.assertEqual(loaded.link, feed.link)
+        self.assertEqual(loaded.name, feed.name)
+        self.assertEqual(loaded.add_time, feed.add_time)
+        self.assertEqual(loaded.last_updated, feed.last_updated)
+        self.assertTrue(loaded.validated)
+        # Validators are only useful alongside the parsed result, which is not saved
+        self.assertIsNone(loaded.etag)
+        self.assertIsNone(loaded.modified)
+    
+    def test_fetch_after_reload_is_a_single_request(self):
+        """Test that a reloaded feed is fetched with one plain request, not a 304 and a retry."""
+        self.feed_source = copy.deepcopy(self._prototype)
+        self.mock_parse.return_value = Mock(status=200, etag='"v1"', modified=None)
+        self.feed_source.fetch(self.test_name)
+        temp_filepath = self._temp_path()
+        self.feed_source.save(temp_filepath)
+        
+        reloaded = FeedSource()
+        reloaded.load(temp_filepath)
+        self.mock_parse.reset_mock()
+        reloaded.fetch(self.test_name)
+        
+        self.mock_parse.assert_called_once_with(self.test_link, etag=None, modified=None)
+    
+    def test_load_records_without_validated_flag(self):
+        """Test loading a msgpack file saved before feeds had a validated flag."""
+        temp_filepath = self._temp_path()
+        with open(temp_filepath, 'wb') as temp_file:
+            temp_file.write(msgpack.packb([[self.test_link, self.test_name, 0.0, 0.0]]))
+        
+        self.feed_source.load(temp_filepath)
+        
+        self.assertEqual(self.feed_source._feed_names, [self.test_name])
+        self.assertFalse(self.feed_source._feeds[0].validated)
+    
+    def test_load_does_not_validate_feeds(self):
+        """Test that loading feeds never touches the network."""
+        self.feed_source = copy.deepcopy(self._prototype_pair)
+        
+        temp_filepath = self._temp_path()
+        self.feed_source.save(temp_filepath)
+        FeedSource().load(temp_filepath)
+        
+        self.mock_parse.assert_not_called()
+        self.mock_head_status.assert_not_called()
+    
+    def test_load_legacy_pickle_file(self):
+        """Test loading a feed list saved as a pickle by earlier versions."""
+        feed = Feed(
+            link=self.test_link,
+            name=self.test_name,
+            add_time=datetime.datetime(2023, 1, 1),
+            last_updated=datetime.datetime(2023, 1, 2),
+        )
+        temp_filepath = self._temp_path(".pkl")
+        with open(temp_filepath, 'wb') as temp_file:
+            pickle.dump([feed], temp_file)
+        
+        with self.assertLogs('acafeed', level='INFO') as cm:
+            self.assertTrue(self.feed_source.load(temp_filepath))
+            output = "\n".join(cm.output)
+            self.assertIn(f"Feed list loaded from {temp_filepath}.", output)
+        
+        self.assertEqual(self.feed_source._feeds, [feed])
+        self.assertEqual(self.feed_source._feed_names, [self.test_name])
+    
+    def test_load_rejects_unexpected_pickle_content(self):
+        """Test that a legacy pickle file cannot run arbitrary code."""
+        class Payload:
+            def __reduce__(self):
+                return (os.remove, ("should-never-be-called",))
+        
+        temp_filepath = self._temp_path(".pkl")
+        with open(temp_filepath, 'wb') as temp_file:
+            pickle.dump([Payload()], temp_file, protocol=pickle.HIGHEST_PROTOCOL)
+        
+        with patch('os.remove') as mock_remove:
+            with self.assertLogs('acafeed', level='INFO') as cm:
+                self.feed_source.load(temp_filepath)
+                output = "\n".join(cm.output)
+                self.assertIn("An error occurred while loading the file:", output)
+            mock_remove.assert_not_called()
+        self.assertEqual(self.feed_source._feeds, [])
     
     def test_load_nonexistent_file(self):
         """Test loading from a file that doesn't exist."""
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            self.feed_source.load("nonexistent_file.pkl")
-            output = mock_stdout.getvalue()
+        with self.assertLogs('acafeed', level='INFO') as cm:
+            self.assertFalse(self.feed_source.load("nonexistent_file.pkl"))
+            output = "\n".join(cm.output)
             self.assertIn("The file nonexistent_file.pkl was not found.", output)
     
     def test_load_corrupted_file(self):
         """Test loading from a corrupted file."""
         # Create a temporary file with invalid pickle data
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as temp_file:
+        temp_filepath = self._temp_path()
+        with open(temp_filepath, 'w') as temp_file:
             temp_file.write("This is not pickle data")
-            temp_filepath = temp_file.name
         
-        try:
-            with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                self.feed_source.load(temp_filepath)
-                output = mock_stdout.getvalue()
-                self.assertIn("An error occurred while loading the file:", output)
-        finally:
-            if os.path.exists(temp_filepath):
-                os.unlink(temp_filepath)
+        with self.assertLogs('acafeed', level='INFO') as cm:
+            self.assertFalse(self.feed_source.load(temp_filepath))
+            output = "\n".join(cm.output)
+            self.assertIn("An error occurred while loading the file:", output)
     
     def test_save_to_invalid_path(self):
         """Test saving to an invalid file path."""
-        invalid_path = "/invalid/path/that/does/not/exist/file.pkl"
-        
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            self.feed_source.save(invalid_path)
-            output = mock_stdout.getvalue()
-            self.assertIn("An error occurred while saving the file:", output)
+        # Fail the open itself, so the test does not depend on the filesystem layout
+        with patch('builtins.open', side_effect=OSError("bad path")):
+            with self.assertLogs('acafeed', level='INFO') as cm:
+                self.feed_source.save("anything.msgpack")
+                output = "\n".join(cm.output)
+                self.assertIn("An error occurred while saving the file:", output)
     
-    @patch('feedparser.parse')
-    def test_fetch_existing_feed(self, mock_parse):
+    def test_fetch_existing_feed(self):
         """Test fetching an existing feed."""
-        # Setup mock for adding feed
-        mock_parse.return_value = Mock(status=200)
-        self.feed_source.add(self.test_link, self.test_name)
+        self.feed_source = copy.deepcopy(self._prototype)
         
         # Setup mock for fetching feed
-        mock_feed_data = Mock()
+        mock_feed_data = Mock(status=200, etag='"abc"', modified="Mon, 01 Jan 2024 00:00:00 GMT")
         mock_feed_data.entries = [{'title': 'Test Article', 'link': 'http://example.com/article'}]
-        mock_parse.return_value = mock_feed_data
+        self.mock_parse.return_value = mock_feed_data
         
         result = self.feed_source.fetch(self.test_name)
         
         self.assertIsNotNone(result)
         self.assertEqual(result, mock_feed_data)
-        mock_parse.assert_called_with(self.test_link)
+        self.mock_parse.assert_called_with(self.test_link, etag=None, modified=None)
+        
+        # The validators are kept for the next conditional request
+        feed = self.feed_source._feeds[0]
+        self.assertEqual(feed.etag, '"abc"')
+        self.assertEqual(feed.modified, "Mon, 01 Jan 2024 00:00:00 GMT")
+    
+    def test_fetch_marks_feed_validated(self):
+        """Test that the first successful fetch validates a feed added without checks."""
+        self.feed_source = copy.deepcopy(self._prototype)
+        feed = self.feed_source._feeds[0]
+        self.assertFalse(feed.validated)
+        
+        self.mock_parse.return_value = Mock(status=500)
+        self.feed_source.fetch(self.test_name)
+        self.assertFalse(feed.validated)
+        
+        self.mock_parse.return_value = _OK_RESPONSE
+        self.feed_source.fetch(self.test_name)
+        self.assertTrue(feed.validated)
+    
+    def test_fetch_not_modified_returns_cached(self):
+        """Test that a 304 response returns the previously parsed feed."""
+        self.feed_source = copy.deepcopy(self._prototype)
+        
+        first = Mock(status=200, etag='"abc"', modified="Mon, 01 Jan 2024 00:00:00 GMT")
+        self.mock_parse.return_value = first
+        self.feed_source.fetch(self.test_name)
+        
+        feed = self.feed_source._feeds[0]
+        last_updated = feed.last_updated
+        
+        # A bare 304 without validators keeps the stored ones
+        self.mock_parse.return_value = Mock(status=304, spec=['status'])
+        result = self.feed_source.fetch(self.test_name)
+        
+        self.assertIs(result, first)
+        self.mock_parse.assert_called_with(
+            self.test_link, etag='"abc"', modified="Mon, 01 Jan 2024 00:00:00 GMT"
+        )
+        self.assertEqual(feed.etag, '"abc"')
+        self.assertEqual(feed.modified, "Mon, 01 Jan 2024 00:00:00 GMT")
+        # Nothing new was downloaded
+        self.assertEqual(feed.last_updated, last_updated)
+    
+    def test_fetch_not_modified_stores_new_validators(self):
+        """Test that validators sent with a 304 replace the stored ones."""
+        self.feed_source = copy.deepcopy(self._prototype)
+        
+        first = Mock(status=200, etag='"abc"', modified="Mon, 01 Jan 2024 00:00:00 GMT")
+        self.mock_parse.return_value = first
+        self.feed_source.fetch(self.test_name)
+        
+        self.mock_parse.return_value = Mock(status=304, etag='"def"', modified="Tue, 02 Jan 2024 00:00:00 GMT")
+        result = self.feed_source.fetch(self.test_name)
+        
+        self.assertIs(result, first)
+        feed = self.feed_source._feeds[0]
+        self.assertEqual(feed.etag, '"def"')
+        self.assertEqual(feed.modified, "Tue, 02 Jan 2024 00:00:00 GMT")
+    
+    def test_fetch_after_link_change_ignores_cache(self):
+        """Test that a 304 for a changed link is not answered from the old link's result."""
+        self.feed_source = copy.deepcopy(self._prototype)
+        self.mock_parse.return_value = Mock(status=200, etag='"abc"', modified=None)
+        self.feed_source.fetch(self.test_name)
+        
+        new_link = "http://example.com/new_rss"
+        self.feed_source.change(self.test_name, new_link=new_link)
+        full = Mock(status=200, etag='"def"', modified=None)
+        self.mock_parse.side_effect = [Mock(status=304), full]
+        
+        self.assertIs(self.feed_source.fetch(self.test_name), full)
+        self.mock_parse.assert_called_with(new_link)
+    
+    def test_parse_cache_is_bounded(self):
+        """Test that results left over from replaced feeds are evicted first."""
+        self.feed_source = copy.deepcopy(self._prototype_pair)
+        versions = iter(range(100))
+        self.mock_parse.side_effect = lambda link, **kwargs: Mock(status=200, etag=f'"{next(versions)}"', modified=None)
+        self.feed_source.fetch_all()
+        stale = list(self.feed_source._parse_cache)
+        # Loading replaces the feeds, but not the results cached for the old ones
+        temp_filepath = self._temp_path()
+        self.feed_source.save(temp_filepath)
+        self.feed_source.load(temp_filepath)
+        
+        with patch('acafeed.feedmanager._PARSE_CACHE_SIZE', 1):
+            self.feed_source.fetch("Feed 1")
+        
+        feed = self.feed_source._feeds[0]
+        self.assertEqual(list(self.feed_source._parse_cache), [stale[1], (self.test_link, feed.etag)])
+        self.assertIsNotNone(feed.etag)
+    
+    def test_parse_cache_holds_every_feed(self):
+        """Test that polling more feeds than the cache size still gets only 304s once they are cached."""
+        names = [f"Feed {i}" for i in range(5)]
+        for name in names:
+            self.feed_source.add(f"http://example.com/{name}", name)
+        
+        def parse(link, etag=None, modified=None):
+            # A server whose feeds never change
+            return Mock(status=304 if etag else 200, etag=f'"{link}"', modified=None)
+        
+        self.mock_parse.side_effect = parse
+        with patch('acafeed.feedmanager._PARSE_CACHE_SIZE', 2):
+            self.feed_source.fetch_all()
+            self.mock_parse.reset_mock()
+            fetched = self.feed_source.fetch_all()
+        
+        self.assertEqual(list(fetched), names)
+        self.assertEqual(self.mock_parse.call_count, len(names))
+        for call in self.mock_parse.call_args_list:
+            self.assertIsNotNone(call.kwargs["etag"])
+        self.assertTrue(all(parsed.status == 200 for parsed in fetched.values()))
+    
+    def test_failed_fetch_keeps_feed_state(self):
+        """Test that a network failure or an error status is not taken as new content."""
+        self.feed_source = copy.deepcopy(self._prototype)
+        first = Mock(status=200, etag='"v1"', modified=None)
+        self.mock_parse.return_value = first
+        self.feed_source.fetch(self.test_name)
+        feed = self.feed_source._feeds[0]
+        last_updated = feed.last_updated
+        self.feed_source._now = lambda: datetime.datetime(2030, 1, 1)
+        
+        # feedparser reports an unreachable host with bozo set and no status
+        for failure in (Mock(spec=['bozo'], bozo=1), Mock(status=404), Mock(status=500)):
+            with self.subTest(failure=failure):
+                self.mock_parse.return_value = failure
+                self.assertIs(self.feed_source.fetch(self.test_name), failure)
+                
+                self.assertEqual(feed.etag, '"v1"')
+                self.assertEqual(feed.last_updated, last_updated)
+                self.assertEqual(list(self.feed_source._parse_cache), [(self.test_link, '"v1"')])
+                self.assertIs(self.feed_source._parse_cache[(self.test_link, '"v1"')], first)
+    
+    def test_fetch_updates_last_updated(self):
+        """Test that fetching new content updates the feed's last_updated time."""
+        self.feed_source = copy.deepcopy(self._prototype)
+        feed = self.feed_source._feeds[0]
+        fetched_at = datetime.datetime(2024, 1, 1, 12, 0)
+        self.feed_source._now = lambda: fetched_at
+        
+        self.mock_parse.return_value = _OK_RESPONSE
+        self.feed_source.fetch(self.test_name)
+        
+        self.assertEqual(feed.last_updated, fetched_at)
+    
+    def test_fetch_not_modified_without_cache(self):
+        """Test that a 304 without a cached result falls back to a full fetch."""
+        self.feed_source = copy.deepcopy(self._prototype)
+        feed = self.feed_source._feeds[0]
+        feed.etag = '"abc"'
+        
+        full = Mock(status=200, etag='"def"', modified=None)
+        self.mock_parse.side_effect = [Mock(status=304), full]
+        result = self.feed_source.fetch(self.test_name)
+        
+        self.assertIs(result, full)
+        self.mock_parse.assert_called_with(self.test_link)
+        self.assertEqual(feed.etag, '"def"')
     
     def test_fetch_nonexistent_feed(self):
         """Test fetching a feed that doesn't exist."""
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+        with self.assertLogs('acafeed', level='INFO') as cm:
             result = self.feed_source.fetch("Nonexistent Feed")
-            output = mock_stdout.getvalue()
+            output = "\n".join(cm.output)
             
             self.assertIsNone(result)
             self.assertIn("The feed Nonexistent Feed was not found in the list.", output)
     
-    @patch('feedparser.parse')
-    def test_fetch_with_multiple_feeds(self, mock_parse):
+    def test_fetch_with_multiple_feeds(self):
         """Test fetching when multiple feeds exist."""
-        mock_parse.return_value = Mock(status=200)
-        
-        # Add multiple feeds
-        self.feed_source.add(self.test_link, "Feed 1")
-        self.feed_source.add("http://example.com/rss", "Feed 2")
+        # Start from a list holding two feeds
+        self.feed_source = copy.deepcopy(self._prototype_pair)
         
         # Setup mock for fetching specific feed
-        mock_feed_data = Mock()
-        mock_parse.return_value = mock_feed_data
+        mock_feed_data = Mock(status=200)
+        self.mock_parse.return_value = mock_feed_data
         
         result = self.feed_source.fetch("Feed 2")
         
         self.assertIsNotNone(result)
         self.assertEqual(result, mock_feed_data)
         # Should be called with the correct feed's link
-        mock_parse.assert_called_with("http://example.com/rss")
+        self.mock_parse.assert_called_with("http://example.com/rss", etag=None, modified=None)
+    
+    def test_fetch_all_feeds(self):
+        """Test fetching all feeds at once."""
+        self.feed_source = copy.deepcopy(self._prototype_pair)
+        
+        # Return a distinct result per link
+        results = {self.test_link: Mock(status=200), "http://example.com/rss": Mock(status=200)}
+        self.mock_parse.side_effect = lambda link, **kwargs: results[link]
+        
+        fetched = self.feed_source.fetch_all()
+        
+        self.assertEqual(fetched, {
+            "Feed 1": results[self.test_link],
+            "Feed 2": results["http://example.com/rss"],
+        })
     
-    def test_fetch_with_inconsistent_data_structure(self):
-        """Test fetch when feed name exists in _feed_names but not in _feeds (edge case)."""
-        # Manually create an inconsistent state (this shouldn't happen in normal usage)
-        self.feed_source._feed_names.append("Inconsistent Feed")
-        # Don't add corresponding feed to _feeds list
+    def test_fetch_all_selected_feeds(self):
+        """Test fetching a subset of feeds, skipping unknown names."""
+        self.feed_source = copy.deepcopy(self._prototype_pair)
+        
+        mock_feed_data = Mock(status=200)
+        self.mock_parse.return_value = mock_feed_data
+        
+        with self.assertLogs('acafeed', level='INFO') as cm:
+            fetched = self.feed_source.fetch_all(["Feed 2", "Nonexistent Feed"])
+            output = "\n".join(cm.output)
+            self.assertIn("The feed Nonexistent Feed was not found in the list.", output)
         
-        result = self.feed_source.fetch("Inconsistent Feed")
+        self.assertEqual(fetched, {"Feed 2": mock_feed_data})
+        self.mock_parse.assert_called_with("http://example.com/rss", etag=None, modified=None)
+    
+    def test_fetch_gone_feed(self):
+        """Test that fetching a gone feed raises like a validated add would."""
+        self.feed_source = copy.deepcopy(self._prototype)
+        self.mock_parse.return_value = Mock(status=410)
         
-        # Should return None because feed object is not found in _feeds
-        self.assertIsNone(result)
+        with self.assertRaisesRegex(ValueError, "The link .* is gone \\(410\\)"):
+            self.feed_source.fetch(self.test_name)
+    
+    def test_fetch_all_checks_status(self):
+        """Test that fetch_all warns on redirects and skips gone feeds."""
+        self.feed_source = copy.deepcopy(self._prototype_pair)
+        
+        moved = Mock(status=301)
+        results = {self.test_link: moved, "http://example.com/rss": Mock(status=410)}
+        self.mock_parse.side_effect = lambda link, **kwargs: results[link]
+        
+        with self.assertLogs('acafeed', level='INFO') as cm:
+            fetched = self.feed_source.fetch_all()
+            output = "\n".join(cm.output)
+            self.assertIn(f"Warning: The link {self.test_link} is redirected (301).", output)
+            self.assertIn("The link http://example.com/rss is gone (410).", output)
+        
+        self.assertEqual(fetched, {"Feed 1": moved})
+    
+    def test_fetch_all_duplicate_names(self):
+        """Test that a feed named twice is only fetched once."""
+        self.feed_source = copy.deepcopy(self._prototype)
+        self.mock_parse.return_value = _OK_RESPONSE
+        
+        fetched = self.feed_source.fetch_all([self.test_name, self.test_name])
+        
+        self.assertEqual(list(fetched), [self.test_name])
+        self.mock_parse.assert_called_once_with(self.test_link, etag=None, modified=None)
+    
+    def test_fetch_all_empty(self):
+        """Test fetching all feeds when there are none."""
+        self.assertEqual(self.feed_source.fetch_all(), {})
 
 
 if __name__ == '__main__':
@@ -0,0 +1,114 @@
+import argparse
+import unittest
+from unittest.mock import Mock, patch
+import main
+from acafeed import FeedSource
+
+
+class TestMain(unittest.TestCase):
+    """Unit tests for the command line interface."""
+
+    def run_main(self, argv, existing=(main.FEEDS_PATH,), loads=True):
+        """Run main() with the given options against a stub FeedSource, and return the stub."""
+        db = Mock(spec=FeedSource)
+        db.load.return_value = loads
+        db._feeds = []
+        db.fetch_all.return_value = {}
+        with patch('sys.argv', ["main.py", *argv]), \
+                patch('acafeed.FeedSource', return_value=db), \
+                patch('os.path.exists', side_effect=lambda path: path in existing), \
+                patch('logging.basicConfig'):
+            main.main()
+        return db
+
+    def test_add_feed_parses_url_and_name(self):
+        """Test splitting an --add-feed value into its link and name."""
+        cases = {
+            "http://example.com/rss (Example)": ("http://example.com/rss", "Example"),
+            # Without a name, the link doubles as the name
+            "https://example.com/rss": ("https://example.com/rss", "https://example.com/rss"),
+            # Only the first " (" separates the name, so it may contain parentheses
+            "http://example.com/rss (Nature (UK))": ("http://example.com/rss", "Nature (UK)"),
+        }
+        for value, (link, name) in cases.items():
+            with self.subTest(value=value):
+                db = Mock(spec=FeedSource)
+                self.assertTrue(main.add_feed(db, argparse.Namespace(add_feed=value)))
+                db.add.assert_called_once_with(link=link, name=name)
+
+    def test_add_feed_rejects_non_http_link(self):
+        """Test that links other than http(s) URLs, and empty or unterminated names, are not added."""
+        for value in (
+            "ftp://example.com/rss (Example)",
+            "example.com/rss",
+            "http://example.com/rss ()",
+            "http://example.com/rss (  )",
+            "http://example.com/rss (Example",
+        ):
+            with self.subTest(value=value):
+                db = Mock(spec=FeedSource)
+                self.assertFalse(main.add_feed(db, argparse.Namespace(add_feed=value)))
+                db.add.assert_not_called()
+
+    def test_add_feed_saves(self):
+        """Test that adding a feed loads the list and saves it back."""
+        db = self.run_main(["--add-feed", "http://example.com/rss (Example)"])
+
+        db.load.assert_called_once_with(main.FEEDS_PATH)
+        db.add.assert_called_once_with(link="http://example.com/rss", name="Example")
+        db.save.assert_called_once_with(main.FEEDS_PATH)
+
+    def test_rejected_add_feed_does_not_save(self):
+        """Test that a rejected link leaves the saved list untouched."""
+        db = self.run_main(["--add-feed", "example.com/rss"])
+
+        db.add.assert_not_called()
+        db.save.assert_not_called()
+
+    def test_list_feeds_does_not_save(self):
+        """Test that listing feeds never writes the list back."""
+        db = self.run_main(["--list-feeds"])
+
+        db.load.assert_called_once_with(main.FEEDS_PATH)
+        db.pprint.assert_called_once_with()
+        db.save.assert_not_called()
+
+    def test_fetch_saves(self):
+        """Test that fetching passes the names on and saves the updated feeds."""
+        for argv, names in ((["--fetch"], None), (["--fetch", "Feed 1", "Feed 2"], ["Feed 1", "Feed 2"])):
+            with self.subTest(argv=argv):
+                db = self.run_main(argv)
+                db.fetch_all.assert_called_once_with(names)
+                db.save.assert_called_once_with(main.FEEDS_PATH)
+
+    def test_legacy_pickle_is_migrated(self):
+        """Test that an old feeds.pkl is loaded and saved again as msgpack."""
+        db = self.run_main(["--list-feeds"], existing=(main.LEGACY_FEEDS_PATH,))
+
+        db.load.assert_called_once_with(main.LEGACY_FEEDS_PATH)
+        db.save.assert_called_once_with(main.FEEDS_PATH)
+
+    def test_failed_migration_does_not_save(self):
+        """Test that an unreadable feeds.pkl is not replaced by an empty msgpack file."""
+        db = self.run_main(["--list-feeds"], existing=(main.LEGACY_FEEDS_PATH,), loads=False)
+
+        db.load.assert_called_once_with(main.LEGACY_FEEDS_PATH)
+        db.save.assert_not_called()
+
+    def test_msgpack_file_takes_precedence(self):
+        """Test that the legacy file is ignored once a msgpack file exists."""
+        db = self.run_main(["--list-feeds"], existing=(main.FEEDS_PATH, main.LEGACY_FEEDS_PATH))
+
+        db.load.assert_called_once_with(main.FEEDS_PATH)
+        db.save.assert_not_called()
+
+    def test_no_options_does_nothing(self):
+        """Test that running without options or a saved list neither loads nor saves."""
+        db = self.run_main([], existing=())
+
+        db.load.assert_not_called()
+        db.save.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()